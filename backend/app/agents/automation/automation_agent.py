@@ -3,22 +3,90 @@ Enhanced Automation Agent using CrewAI for intelligent browser automation planni
 Generates structured execution plans for Nova Act agent and processes results.
 """
 
-import os
 import json
 import re
+import asyncio
+import functools
+import time
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 from dotenv import load_dotenv
+import orjson
 
 from crewai import Agent, Task, Crew, Process, LLM
 
 from app.core.logging import get_logger
+from app.config import settings
+from app.core.cache import TTLCache, make_cache_key
 
 # Load environment variables
 load_dotenv()
 
 logger = get_logger(__name__)
 
+# Payment-related keywords that must never appear in a summons-checking plan
+PAYMENT_KEYWORDS = (
+    'pay', 'payment', 'settle', 'transaction', 'checkout', 'credit card', 
+    'bank transfer', 'debit card', 'online banking', 'e-wallet', 'finish payment',
+    'complete payment', 'process payment', 'submit payment', 'confirm payment',
+    'payment method', 'payment form', 'payment gateway', 'billing', 'invoice'
+)
+
+# Single alternation over all keywords: one scan per instruction instead of one per keyword
+PAYMENT_KEYWORDS_RE = re.compile("|".join(map(re.escape, PAYMENT_KEYWORDS)))
+
+# Nova Act action types that are payment actions regardless of instruction text
+PAYMENT_ACTION_TYPES = frozenset({'pay', 'payment', 'transaction'})
+
+# Common credential field names to look for in user context, in priority order
+CREDENTIAL_FIELDS = (
+    ('email', ('email', 'username', 'user_email', 'login_email')),
+    ('password', ('password', 'pass', 'user_password', 'login_password')),
+    ('ic_number', ('ic_number', 'ic', 'nric', 'identity_card', 'id_number')),
+    ('phone', ('phone', 'phone_number', 'mobile', 'mobile_number')),
+    ('name', ('name', 'full_name', 'user_name', 'display_name'))
+)
+
+# Error types that can potentially be improved
+IMPROVABLE_ERRORS = frozenset({
+    "general_difficulties",
+    "cannot_proceed",
+    "timeout",
+    "element_not_found"
+})
+
+# Error types that cannot be improved (require human intervention)
+NON_IMPROVABLE_ERRORS = frozenset({
+    "infinite_loop",
+    "authentication_required",
+    "captcha_required",
+    "payment_required",
+    "permission_denied"
+})
+
+# Words in an error-detection suggestion that indicate the plan can be adjusted
+IMPROVEMENT_KEYWORDS_RE = re.compile(
+    r"try|retry|different|alternative|modify|adjust|change", re.IGNORECASE
+)
+
+# Verified tutorials are reused for equivalent failures until the underlying
+# sites are likely to change
+TUTORIAL_CACHE_TTL_SECONDS = 6 * 60 * 60
+
+# Task fields that feed the tutorial prompt (and therefore its cache key)
+TUTORIAL_PROMPT_FIELDS = ("user_message", "extracted_credentials", "user_context", "task_description", "target_website")
+
+
+def _session_timestamp() -> str:
+    """UTC timestamp used in generated session IDs, e.g. 20240131_235959."""
+    return time.strftime('%Y%m%d_%H%M%S', time.gmtime())
+
+
+@functools.cache
+def _error_type_label(error_type: str) -> str:
+    """Human-readable label for an error type, e.g. element_not_found -> Element Not Found."""
+    return error_type.replace('_', ' ').title()
+
 
 # Data classes for structured output (no Pydantic validation)
 class EnhancedMicroStep:
@@ -89,7 +157,6 @@ class MicroStepGeneratorAgent:
     
     def __init__(self, llm: LLM):
         self.llm = llm
-        self.agent = self._create_agent()
     
     def _create_agent(self) -> Agent:
         """Create the micro-step generator agent."""
@@ -116,6 +183,10 @@ class MicroStepGeneratorAgent:
     def generate_execution_plan(self, validation_result: Dict[str, Any], task_description: str = "", credentials: Dict[str, Any] = None) -> AutomationExecutionPlan:
         """Generate final structured execution plan using CrewAI."""
         try:
+            # Built per call: CrewAI agents hold per-run state, and plans are
+            # generated both on the event loop and from worker threads
+            agent = self._create_agent()
+            
             # Create task for execution plan generation
             credentials_info = ""
             if credentials:
@@ -287,12 +358,12 @@ class MicroStepGeneratorAgent:
                 Focus on creating a robust, intelligent automation plan that Nova Act can execute without additional processing.
                 """,
                 expected_output="JSON response with complete automation execution plan for Nova Act",
-                agent=self.agent
+                agent=agent
             )
             
             # Execute the task
             crew = Crew(
-                agents=[self.agent],
+                agents=[agent],
                 tasks=[task],
                 process=Process.sequential,
                 verbose=True
@@ -333,7 +404,7 @@ class MicroStepGeneratorAgent:
             logger.warning(f"Failed to parse JSON response: {str(e)}")
             # Return a basic structure if JSON parsing fails
             return {
-                "session_id": f"fallback_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}",
+                "session_id": f"fallback_{_session_timestamp()}",
                 "task_description": "Fallback plan",
                 "target_website": "https://www.myeg.com.my",
                 "micro_steps": [],
@@ -360,14 +431,6 @@ class MicroStepGeneratorAgent:
             Filtered execution plan data with payment steps removed
         """
         try:
-            # Payment-related keywords to filter out
-            payment_keywords = [
-                'pay', 'payment', 'settle', 'transaction', 'checkout', 'credit card', 
-                'bank transfer', 'debit card', 'online banking', 'e-wallet', 'finish payment',
-                'complete payment', 'process payment', 'submit payment', 'confirm payment',
-                'payment method', 'payment form', 'payment gateway', 'billing', 'invoice'
-            ]
-            
             # Get micro steps
             micro_steps = execution_plan_data.get('micro_steps', [])
             filtered_steps = []
@@ -378,8 +441,8 @@ class MicroStepGeneratorAgent:
                 nova_act_type = step.get('nova_act_type', '').lower()
                 
                 # Check if step contains payment-related keywords
-                contains_payment = any(keyword in instruction for keyword in payment_keywords)
-                is_payment_action = nova_act_type in ['pay', 'payment', 'transaction']
+                contains_payment = PAYMENT_KEYWORDS_RE.search(instruction) is not None
+                is_payment_action = nova_act_type in PAYMENT_ACTION_TYPES
                 
                 if contains_payment or is_payment_action:
                     logger.warning(f"Removing payment-related step: {step.get('instruction', '')}")
@@ -437,7 +500,7 @@ class MicroStepGeneratorAgent:
             
             # Create the execution plan
             return AutomationExecutionPlan(
-                session_id=data.get('session_id', f"plan_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"),
+                session_id=data['session_id'] if 'session_id' in data else f"plan_{_session_timestamp()}",
                 task_description=data.get('task_description', task_description),
                 target_website=data.get('target_website', 'https://www.myeg.com.my'),
                 micro_steps=micro_steps,
@@ -459,7 +522,7 @@ class MicroStepGeneratorAgent:
         try:
             # Create a basic fallback plan
             return AutomationExecutionPlan(
-                session_id=f"fallback_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}",
+                session_id=f"fallback_{_session_timestamp()}",
                 task_description=task_description,
                 target_website="https://www.myeg.com.my",
                 micro_steps=[
@@ -489,7 +552,7 @@ class MicroStepGeneratorAgent:
     def _create_fallback_plan(self, validation_result: Dict[str, Any], task_description: str) -> AutomationExecutionPlan:
         """Create a basic fallback plan when CrewAI fails."""
         return AutomationExecutionPlan(
-            session_id=f"fallback_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}",
+            session_id=f"fallback_{_session_timestamp()}",
             task_description=task_description,
             target_website="https://www.myeg.com.my",
             micro_steps=[
@@ -526,8 +589,8 @@ class AutomationAgent:
         
         # Initialize Tavily tool for fact-checking
         try:
-            from ..coordinator.tavily_tool import TavilySearchTool
-            self.tavily_tool = TavilySearchTool()
+            from ..coordinator.tavily_tool import get_tavily_search_tool
+            self.tavily_tool = get_tavily_search_tool()
             logger.info("Tavily search tool initialized successfully for fact-checking")
         except Exception as e:
             logger.warning(f"Failed to initialize Tavily tool: {str(e)}")
@@ -536,6 +599,9 @@ class AutomationAgent:
         # Browser session tracking
         self._active_browser_sessions = []
         
+        # Cache of verified tutorials keyed on the failed task
+        self._tutorial_cache = TTLCache(ttl_seconds=TUTORIAL_CACHE_TTL_SECONDS)
+        
         logger.info("Enhanced automation agent initialized successfully with CrewAI-based micro-step generation and fact-checking capabilities")
     
     def _extract_credentials(self, user_context: Dict[str, Any]) -> Dict[str, Any]:
@@ -689,16 +755,7 @@ class AutomationAgent:
         """
         credentials = {}
         
-        # Common credential field names to look for
-        credential_fields = {
-            'email': ['email', 'username', 'user_email', 'login_email'],
-            'password': ['password', 'pass', 'user_password', 'login_password'],
-            'ic_number': ['ic_number', 'ic', 'nric', 'identity_card', 'id_number'],
-            'phone': ['phone', 'phone_number', 'mobile', 'mobile_number'],
-            'name': ['name', 'full_name', 'user_name', 'display_name']
-        }
-        
-        for credential_type, field_names in credential_fields.items():
+        for credential_type, field_names in CREDENTIAL_FIELDS:
             for field_name in field_names:
                 if field_name in user_context and user_context[field_name]:
                     credentials[credential_type] = user_context[field_name]
@@ -711,9 +768,9 @@ class AutomationAgent:
         try:
             return LLM(
                 model="bedrock/amazon.nova-pro-v1:0",
-                aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-                aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-                aws_region_name=os.getenv('BEDROCK_REGION', 'ap-southeast-2'),  # Use Bedrock region
+                aws_access_key_id=settings.aws_access_key_id,
+                aws_secret_access_key=settings.aws_secret_access_key,
+                aws_region_name=settings.bedrock_region,  # Use Bedrock region
                 stream=True
             )
         except Exception as e:
@@ -812,6 +869,23 @@ class AutomationAgent:
                 "requires_human": True
             }
     
+    async def aprocess_nova_act_result(self, nova_act_result: Dict[str, Any], original_task: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Async variant of process_nova_act_result for callers on the event loop.
+        
+        Plan improvement and tutorial generation are blocking CrewAI calls, so
+        they run in a worker thread and concurrent results can be processed
+        together with asyncio.gather.
+        
+        Args:
+            nova_act_result: Result from Nova Act agent execution
+            original_task: Original automation task
+            
+        Returns:
+            Dictionary with next action and result
+        """
+        return await asyncio.to_thread(self.process_nova_act_result, nova_act_result, original_task)
+    
     def process_nova_act_result(self, nova_act_result: Dict[str, Any], original_task: Dict[str, Any]) -> Dict[str, Any]:
         """
         Process Nova Act execution result and determine next action.
@@ -1027,36 +1101,15 @@ class AutomationAgent:
         Returns:
             Boolean indicating if plan can be improved
         """
-        # Error types that can potentially be improved
-        improvable_errors = [
-            "general_difficulties",
-            "cannot_proceed",
-            "timeout",
-            "element_not_found"
-        ]
-        
-        # Error types that cannot be improved (require human intervention)
-        non_improvable_errors = [
-            "infinite_loop",
-            "authentication_required",
-            "captcha_required",
-            "payment_required",
-            "permission_denied"
-        ]
-        
-        if error_type in non_improvable_errors:
+        if error_type in NON_IMPROVABLE_ERRORS:
             return False
         
-        if error_type in improvable_errors:
+        if error_type in IMPROVABLE_ERRORS:
             return True
         
         # Check suggestions for improvement indicators
-        improvement_keywords = [
-            "try", "retry", "different", "alternative", "modify", "adjust", "change"
-        ]
-        
         for suggestion in suggestions:
-            if any(keyword in suggestion.lower() for keyword in improvement_keywords):
+            if IMPROVEMENT_KEYWORDS_RE.search(suggestion):
                 return True
         
         return False
@@ -1074,6 +1127,12 @@ class AutomationAgent:
             Tutorial string for the user
         """
         try:
+            cache_key = self._tutorial_cache_key(original_task, error_type, suggestions)
+            cached_tutorial = self._tutorial_cache.get(cache_key)
+            if cached_tutorial is not None:
+                logger.info("Using cached tutorial for identical failed task")
+                return cached_tutorial
+            
             logger.info("Generating tutorial using CrewAI agent...")
             
             # Get user message and credentials for context
@@ -1101,7 +1160,7 @@ class AutomationAgent:
                 TASK DETAILS:
                 - Task Description: {original_task.get('task_description', 'Unknown task')}
                 - Target Website: {original_task.get('target_website', 'Unknown website')}
-                - Error Type: {error_type.replace('_', ' ').title()}
+                - Error Type: {_error_type_label(error_type)}
                 - Suggestions from automation: {', '.join(suggestions) if suggestions else 'None provided'}
                 
                 FACT-CHECKING REQUIREMENTS:
@@ -1173,6 +1232,8 @@ class AutomationAgent:
                 # Append fact-checking information to tutorial
                 fact_check_info = f"\n\n---\n**Last Verified:** {fact_check_result.get('timestamp', 'Unknown')}\n**Fact-Checking Status:** ✅ Verified"
                 tutorial_content += fact_check_info
+                # Only verified tutorials are reused; unverified ones are regenerated
+                self._tutorial_cache.set(cache_key, tutorial_content)
             else:
                 logger.warning("Tutorial fact-checking failed or unavailable")
                 fact_check_info = f"\n\n---\n**Last Verified:** {fact_check_result.get('timestamp', 'Unknown')}\n**Fact-Checking Status:** ⚠️ Verification unavailable - please verify information manually"
@@ -1185,6 +1246,21 @@ class AutomationAgent:
             # Fallback to basic tutorial
             return self._generate_fallback_tutorial(original_task, error_type, suggestions)
     
+    def _tutorial_cache_key(self, original_task: Dict[str, Any], error_type: str, suggestions: List[str]) -> str:
+        """
+        Build a cache key from the inputs the tutorial prompt actually uses.
+        
+        Other task fields (session ids, timestamps, step lists) do not change the
+        generated tutorial, so they are left out and equivalent failures share an entry.
+        """
+        task_fields = {field: original_task.get(field) for field in TUTORIAL_PROMPT_FIELDS}
+        canonical = orjson.dumps(
+            {"task": task_fields, "error_type": error_type, "suggestions": suggestions},
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            default=str
+        )
+        return make_cache_key(canonical.decode())
+    
     def _create_tutorial_generation_agent(self) -> Agent:
         """Create a specialized CrewAI agent for tutorial generation."""
         # Add Tavily tool if available
@@ -1340,7 +1416,7 @@ class AutomationAgent:
 {ic_number}
 
 ## What went wrong:
-{error_type.replace('_', ' ').title()}
+{_error_type_label(error_type)}
 
 ## Step-by-step manual instructions for checking summons:
 
@@ -1439,26 +1515,12 @@ class AutomationAgent:
         try:
             logger.info(f"Closing {len(self._active_browser_sessions)} active browser sessions...")
             
-            for session in self._active_browser_sessions:
-                try:
-                    session_id = session['session_id']
-                    nova_act = session['nova_act']
-                    
-                    logger.debug(f"Closing browser session: {session_id}")
-                    
-                    # Check if Nova Act instance has stop method
-                    if hasattr(nova_act, 'stop'):
-                        nova_act.stop()
-                        logger.debug(f"Stopped Nova Act session: {session_id}")
-                    elif hasattr(nova_act, 'close'):
-                        nova_act.close()
-                        logger.debug(f"Closed Nova Act session: {session_id}")
-                    else:
-                        logger.warning(f"Nova Act session {session_id} has no stop/close method")
-                        
-                except Exception as e:
-                    logger.warning(f"Error closing browser session {session.get('session_id', 'unknown')}: {str(e)}")
-                    continue
+            # Sessions are independent, so tear them down concurrently
+            sessions = list(self._active_browser_sessions)
+            await asyncio.gather(
+                *(self._close_browser_session(session) for session in sessions),
+                return_exceptions=True
+            )
             
             # Clear all sessions
             self._active_browser_sessions.clear()
@@ -1469,6 +1531,28 @@ class AutomationAgent:
             # Clear sessions even if there was an error
             self._active_browser_sessions.clear()
     
+    async def _close_browser_session(self, session: Dict[str, Any]):
+        """Close a single browser session, logging instead of raising on failure."""
+        try:
+            session_id = session['session_id']
+            nova_act = session['nova_act']
+            
+            logger.debug(f"Closing browser session: {session_id}")
+            
+            # Check if Nova Act instance has stop method
+            # (stop/close are blocking, so run them off the event loop)
+            if hasattr(nova_act, 'stop'):
+                await asyncio.to_thread(nova_act.stop)
+                logger.debug(f"Stopped Nova Act session: {session_id}")
+            elif hasattr(nova_act, 'close'):
+                await asyncio.to_thread(nova_act.close)
+                logger.debug(f"Closed Nova Act session: {session_id}")
+            else:
+                logger.warning(f"Nova Act session {session_id} has no stop/close method")
+                
+        except Exception as e:
+            logger.warning(f"Error closing browser session {session.get('session_id', 'unknown')}: {str(e)}")
+    
     def get_health_status(self) -> Dict[str, Any]:
         """Get health status of the automation agent."""
         try:
@@ -11,6 +11,15 @@ from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Viewer features as per AWS samples, pre-joined so start() emits one record
+VIEWER_FEATURES_MESSAGE = "\n".join([
+    "Viewer Features:",
+    "• Default display: 1600×900 (configured via displayLayout callback)",
+    "• Size options: 720p, 900p, 1080p, 1440p",
+    "• Real-time display updates",
+    "• Take/Release control functionality"
+])
+
 
 class BrowserViewerServer:
     """
@@ -69,11 +78,7 @@ class BrowserViewerServer:
             logger.info(f"BrowserViewerServer started successfully on {self.live_view_url}")
             
             # Log the features as per AWS samples
-            logger.info("Viewer Features:")
-            logger.info("• Default display: 1600×900 (configured via displayLayout callback)")
-            logger.info("• Size options: 720p, 900p, 1080p, 1440p")
-            logger.info("• Real-time display updates")
-            logger.info("• Take/Release control functionality")
+            logger.info(VIEWER_FEATURES_MESSAGE)
             
             return self.live_view_url
             
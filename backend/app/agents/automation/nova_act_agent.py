@@ -4,33 +4,112 @@ This agent executes Nova Act instructions directly with BOOL_SCHEMA error detect
 and structured output for CrewAI integration.
 """
 
-import os
+import re
 import time
 import asyncio
+import threading
 import concurrent.futures
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, TYPE_CHECKING
 from datetime import datetime
+from dataclasses import dataclass
 
-from nova_act import NovaAct, BOOL_SCHEMA
-from bedrock_agentcore.tools.browser_client import browser_session
-
+from app.config import settings
 from app.core.logging import get_logger
 
+if TYPE_CHECKING:
+    # nova_act (Playwright) and bedrock_agentcore are heavy imports; they are
+    # loaded on first execution instead of when the agent module is imported
+    from nova_act import NovaAct
+
 logger = get_logger(__name__)
 
+# Wall-clock limit for a whole execution plan when run off the event loop
+PLAN_TIMEOUT_SECONDS = 300
+
+# Upper bound on concurrent browser sessions for plans with a "parallel" strategy
+MAX_PARALLEL_SESSIONS = 4
+
+# Upper bound on plans run concurrently from the event loop; further plans queue
+MAX_CONCURRENT_PLANS = 4
+
+# Timeout for each BOOL_SCHEMA question asked during error detection
+ERROR_DETECTION_TIMEOUT_SECONDS = 30
+
+
+def _default_step_success(result_text: str) -> bool:
+    """Treat a step as successful unless its output reports an error."""
+    return "error" not in result_text and "failed" not in result_text
+
+
+# Explicit outcome words in a Nova Act response, matched case-insensitively in one pass
+RESPONSE_SUCCESS_RE = re.compile(r"success|completed|done|finished", re.IGNORECASE)
+RESPONSE_ERROR_RE = re.compile(r"error|failed|cannot|unable", re.IGNORECASE)
+
+# Success checks per nova_act_type, applied to the lowercased result text
+STEP_SUCCESS_CHECKS = {
+    # For navigation steps, success is usually just reaching the page
+    "navigate": lambda result_text: True,
+    # For click steps, success is usually if no error occurred
+    "click": lambda result_text: "error" not in result_text,
+    # For input steps, success is usually if text was entered
+    "input": lambda result_text: "entered" in result_text or "filled" in result_text,
+}
 
+
+# Background workers for browser session teardown. Executor threads are joined
+# at interpreter exit, so pending stops still complete on shutdown.
+_BROWSER_TEARDOWN_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="browser-teardown"
+)
+
+
+# Dedicated workers for plans started from the event loop. Browser sessions hold
+# a thread for minutes, so they must not tie up the loop's default executor,
+# which also serves DynamoDB lookups and CrewAI kickoff_async.
+_PLAN_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENT_PLANS, thread_name_prefix="nova-act-plan"
+)
+
+
+def _plan_timeout_result(execution_plan: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the result returned when a plan overruns PLAN_TIMEOUT_SECONDS."""
+    return {
+        'status': 'error',
+        'message': 'Execution timed out after 5 minutes',
+        'session_id': execution_plan.get('session_id', 'unknown'),
+        'completed_steps': [],
+        'failed_step': None,
+        'error_detection': None,
+        'success_count': 0,
+        'failed_count': 1,
+        'requires_human': True,
+        'suggestions': ['Task took too long, try with simpler steps']
+    }
+
+
+def _stop_browser_client(client) -> None:
+    """Stop an AgentCore browser session, logging instead of raising on failure."""
+    try:
+        client.stop()
+        logger.debug("Browser session stopped")
+    except Exception as e:
+        logger.warning(f"Error stopping browser session: {str(e)}")
+
+
+@dataclass(slots=True)
 class NovaActExecutionResult:
     """Data class for Nova Act execution results."""
-    def __init__(self, instruction: str, status: str, result_text: str, 
-                 error_message: str = None, execution_time: float = 0.0, 
-                 retry_count: int = 0, browser_state: Dict[str, Any] = None):
-        self.instruction = instruction
-        self.status = status  # "success", "failed", "timeout", "blackhole_detected"
-        self.result_text = result_text
-        self.error_message = error_message
-        self.execution_time = execution_time
-        self.retry_count = retry_count
-        self.browser_state = browser_state or {}
+    instruction: str
+    status: str  # "success", "failed", "timeout", "blackhole_detected"
+    result_text: str
+    error_message: Optional[str] = None
+    execution_time: float = 0.0
+    retry_count: int = 0
+    browser_state: Optional[Dict[str, Any]] = None
+    
+    def __post_init__(self):
+        if self.browser_state is None:
+            self.browser_state = {}
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -45,15 +124,18 @@ class NovaActExecutionResult:
         }
 
 
+@dataclass(slots=True)
 class NovaActErrorDetection:
     """Data class for error detection results."""
-    def __init__(self, has_difficulties: bool, is_stuck_in_loop: bool, can_proceed: bool,
-                 error_type: str = None, suggestions: List[str] = None):
-        self.has_difficulties = has_difficulties
-        self.is_stuck_in_loop = is_stuck_in_loop
-        self.can_proceed = can_proceed
-        self.error_type = error_type
-        self.suggestions = suggestions or []
+    has_difficulties: bool
+    is_stuck_in_loop: bool
+    can_proceed: bool
+    error_type: Optional[str] = None
+    suggestions: Optional[List[str]] = None
+    
+    def __post_init__(self):
+        if self.suggestions is None:
+            self.suggestions = []
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -66,24 +148,23 @@ class NovaActErrorDetection:
         }
 
 
+@dataclass(slots=True)
 class NovaActExecutionSummary:
     """Data class for complete execution summary."""
-    def __init__(self, status: str, message: str, session_id: str, 
-                 completed_steps: List[NovaActExecutionResult], 
-                 failed_step: NovaActExecutionResult = None,
-                 error_detection: NovaActErrorDetection = None,
-                 success_count: int = 0, failed_count: int = 0,
-                 requires_human: bool = False, suggestions: List[str] = None):
-        self.status = status  # "success", "partial", "failed", "error"
-        self.message = message
-        self.session_id = session_id
-        self.completed_steps = completed_steps
-        self.failed_step = failed_step
-        self.error_detection = error_detection
-        self.success_count = success_count
-        self.failed_count = failed_count
-        self.requires_human = requires_human
-        self.suggestions = suggestions or []
+    status: str  # "success", "partial", "failed", "error"
+    message: str
+    session_id: str
+    completed_steps: List[NovaActExecutionResult]
+    failed_step: Optional[NovaActExecutionResult] = None
+    error_detection: Optional[NovaActErrorDetection] = None
+    success_count: int = 0
+    failed_count: int = 0
+    requires_human: bool = False
+    suggestions: Optional[List[str]] = None
+    
+    def __post_init__(self):
+        if self.suggestions is None:
+            self.suggestions = []
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary (replaces Pydantic model_dump)."""
@@ -106,7 +187,7 @@ class NovaActAgent:
     
     def __init__(self):
         # Configuration
-        self.nova_act_api_key = os.getenv("NOVA_ACT_API_KEY")
+        self.nova_act_api_key = settings.nova_act_api_key
         self.aws_region = "us-east-1"
         
         logger.info("Nova Act agent initialized successfully with direct execution")
@@ -123,9 +204,29 @@ class NovaActAgent:
             logger.info("✅ DIAGNOSTIC: Nova Act called from sync context - safe!")
             return False
     
-    def _execute_nova_act_sync(self, execution_plan: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute Nova Act in synchronous context (for thread isolation)."""
+    def _execute_nova_act_sync(self, execution_plan: Dict[str, Any],
+                               cancel_event: Optional[threading.Event] = None) -> Dict[str, Any]:
+        """
+        Execute Nova Act in synchronous context (for thread isolation).
+        
+        Args:
+            execution_plan: Complete execution plan from automation agent
+            cancel_event: Set by the caller when it stops waiting; remaining
+                steps and retries are skipped once it is set
+            
+        Returns:
+            Dictionary with execution results
+        """
+        if cancel_event is None:
+            cancel_event = threading.Event()
+        
+        if self._is_parallel_plan(execution_plan):
+            return self._execute_parallel_plan(execution_plan, cancel_event)
+        
         try:
+            from nova_act import NovaAct
+            from bedrock_agentcore.tools.browser_client import BrowserClient
+            
             # Extract plan details
             task_description = execution_plan.get('task_description', 'Automation task')
             session_id = execution_plan.get('session_id', f"session_{int(time.time())}")
@@ -138,7 +239,9 @@ class NovaActAgent:
             logger.info(f"Micro-steps count: {len(micro_steps)}")
             
             # Start fresh session each time
-            with browser_session(self.aws_region) as client:
+            client = BrowserClient(self.aws_region)
+            client.start()
+            try:
                 ws_url, headers = client.generate_ws_headers()
                 
                 # # Create and start the BrowserViewerServer to get live view URL
@@ -209,7 +312,7 @@ class NovaActAgent:
                     
                     # Execute micro-steps with error detection and credentials
                     execution_summary = self._execute_steps_with_error_detection(
-                        nova_act, micro_steps, session_id, credentials
+                        nova_act, micro_steps, session_id, credentials, cancel_event
                     )
                     
                     # Convert to dictionary for return
@@ -224,6 +327,10 @@ class NovaActAgent:
                     #         logger.warning(f"Error stopping BrowserViewerServer: {e}")
                     
                     return result
+            finally:
+                # Stop the remote browser in the background so the result is
+                # returned without waiting on the teardown round trip
+                _BROWSER_TEARDOWN_EXECUTOR.submit(_stop_browser_client, client)
                     
         except KeyboardInterrupt:
             logger.warning("Nova Act execution interrupted by user (KeyboardInterrupt)")
@@ -240,7 +347,7 @@ class NovaActAgent:
                 'suggestions': ['Execution was interrupted, please try again']
             }
         except Exception as e:
-            logger.error(f"Failed to execute Nova Act plan: {str(e)}")
+            logger.exception(f"Failed to execute Nova Act plan: {str(e)}")
             return {
                 'status': 'error',
                 'message': f'Execution failed: {str(e)}',
@@ -254,6 +361,94 @@ class NovaActAgent:
                 'suggestions': ['Check browser connection and try again']
             }
     
+    def _is_parallel_plan(self, execution_plan: Dict[str, Any]) -> bool:
+        """Check if the plan declares its micro-steps independent of each other."""
+        strategy = str(execution_plan.get('execution_strategy', '')).strip().lower()
+        return strategy == "parallel" and len(execution_plan.get('micro_steps', [])) > 1
+    
+    def _execute_parallel_plan(self, execution_plan: Dict[str, Any],
+                               cancel_event: threading.Event) -> Dict[str, Any]:
+        """
+        Execute independent micro-steps concurrently, one browser session per step.
+        
+        Each step runs as its own single-step sequential plan, and the per-step
+        results are merged back in step_number order.
+        
+        Args:
+            execution_plan: Execution plan with execution_strategy "parallel"
+            cancel_event: Shared with every step session so all of them stop together
+            
+        Returns:
+            Dictionary with merged execution results
+        """
+        micro_steps = execution_plan.get('micro_steps', [])
+        session_id = execution_plan.get('session_id', f"session_{int(time.time())}")
+        
+        logger.info(f"Executing {len(micro_steps)} independent micro-steps in parallel browser sessions")
+        
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(micro_steps), MAX_PARALLEL_SESSIONS),
+            thread_name_prefix="nova-act-step"
+        ) as executor:
+            futures = {}
+            for index, step in enumerate(micro_steps, 1):
+                step_number = step.get('step_number', index)
+                step_plan = {
+                    **execution_plan,
+                    'session_id': f"{session_id}_step{step_number}",
+                    'micro_steps': [step],
+                    'execution_strategy': 'sequential'
+                }
+                # Index breaks ties if the plan repeats a step_number
+                futures[(step_number, index)] = executor.submit(self._execute_nova_act_sync, step_plan, cancel_event)
+            
+            step_results = {key: future.result() for key, future in futures.items()}
+        
+        completed_steps = []
+        suggestions = []
+        failed_step = None
+        error_detection = None
+        success_count = 0
+        failed_count = 0
+        requires_human = False
+        
+        for key in sorted(step_results):
+            result = step_results[key]
+            completed_steps.extend(result.get('completed_steps', []))
+            success_count += result.get('success_count', 0)
+            failed_count += result.get('failed_count', 0)
+            requires_human = requires_human or result.get('requires_human', False)
+            suggestions.extend(result.get('suggestions', []))
+            
+            # Report the earliest failing step, like sequential execution does
+            if failed_step is None and result.get('failed_step'):
+                failed_step = result['failed_step']
+                error_detection = result.get('error_detection')
+        
+        # Determine final status
+        if failed_count == 0:
+            status = "success"
+            message = f"Successfully executed all {len(micro_steps)} micro-steps in parallel"
+        elif success_count > 0:
+            status = "partial"
+            message = f"Executed {len(micro_steps)} micro-steps in parallel: {success_count} successful, {failed_count} failed"
+        else:
+            status = "failed"
+            message = f"Failed to execute any of the {len(micro_steps)} micro-steps"
+        
+        return {
+            'status': status,
+            'message': message,
+            'session_id': session_id,
+            'completed_steps': completed_steps,
+            'failed_step': failed_step,
+            'error_detection': error_detection,
+            'success_count': success_count,
+            'failed_count': failed_count,
+            'requires_human': requires_human or failed_count > 0,
+            'suggestions': suggestions
+        }
+    
     def execute_execution_plan(self, execution_plan: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute a complete automation execution plan from the automation agent.
@@ -272,28 +467,20 @@ class NovaActAgent:
             # Run in separate thread to avoid asyncio/Playwright conflict
             logger.info("🔄 Running Nova Act in separate thread to avoid asyncio conflict")
             
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(self._execute_nova_act_sync, execution_plan)
+            cancel_event = threading.Event()
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            try:
+                future = executor.submit(self._execute_nova_act_sync, execution_plan, cancel_event)
                 try:
-                    result = future.result(timeout=300)  # 5 minute timeout
+                    result = future.result(timeout=PLAN_TIMEOUT_SECONDS)
                     logger.info("✅ Nova Act execution completed successfully in thread")
                     return result
                 except concurrent.futures.TimeoutError:
                     logger.error("❌ Nova Act execution timed out")
-                    return {
-                        'status': 'error',
-                        'message': 'Execution timed out after 5 minutes',
-                        'session_id': execution_plan.get('session_id', 'unknown'),
-                        'completed_steps': [],
-                        'failed_step': None,
-                        'error_detection': None,
-                        'success_count': 0,
-                        'failed_count': 1,
-                        'requires_human': True,
-                        'suggestions': ['Task took too long, try with simpler steps']
-                    }
+                    cancel_event.set()
+                    return _plan_timeout_result(execution_plan)
                 except Exception as e:
-                    logger.error(f"❌ Nova Act execution failed in thread: {str(e)}")
+                    logger.exception(f"❌ Nova Act execution failed in thread: {str(e)}")
                     return {
                         'status': 'error',
                         'message': f'Thread execution failed: {str(e)}',
@@ -306,26 +493,70 @@ class NovaActAgent:
                         'requires_human': True,
                         'suggestions': ['Check browser connection and try again']
                     }
+            finally:
+                # Don't wait for an overrunning worker here (a `with` block would).
+                # The cancel event stops it before its next step or retry, and the
+                # act() call in flight is bounded by the step timeout
+                executor.shutdown(wait=False)
         else:
             # Run directly in sync context (like test script)
             logger.info("✅ Running Nova Act directly in sync context")
             return self._execute_nova_act_sync(execution_plan)
     
+    async def aexecute_execution_plan(self, execution_plan: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Async variant of execute_execution_plan for callers on the event loop.
+        
+        The blocking Nova Act session runs on the dedicated plan executor, so the
+        loop keeps serving other requests while the browser works.
+        
+        Args:
+            execution_plan: Complete execution plan from automation agent
+            
+        Returns:
+            Dictionary with execution results
+        """
+        cancel_event = threading.Event()
+        try:
+            loop = asyncio.get_running_loop()
+            result = await asyncio.wait_for(
+                loop.run_in_executor(_PLAN_EXECUTOR, self._execute_nova_act_sync, execution_plan, cancel_event),
+                timeout=PLAN_TIMEOUT_SECONDS
+            )
+            logger.info("✅ Nova Act execution completed successfully in thread")
+            return result
+        except asyncio.TimeoutError:
+            # Cancelling the await drops a plan still queued, but does not stop a
+            # running worker thread, so tell it to stop before its next step or retry
+            logger.error("❌ Nova Act execution timed out")
+            cancel_event.set()
+            return _plan_timeout_result(execution_plan)
+    
     def _execute_steps_with_error_detection(
         self, 
-        nova_act: NovaAct, 
+        nova_act: "NovaAct", 
         micro_steps: List[Dict[str, Any]], 
         session_id: str,
-        credentials: Dict[str, Any] = None
+        credentials: Dict[str, Any] = None,
+        cancel_event: Optional[threading.Event] = None
     ) -> NovaActExecutionSummary:
         """Execute micro-steps with intelligent error detection using BOOL_SCHEMA."""
         
+        if cancel_event is None:
+            cancel_event = threading.Event()
+        
         completed_steps = []
         success_count = 0
         failed_count = 0
         failed_step = None
+        cancelled = False
         
         for step in micro_steps:
+            if cancel_event.is_set():
+                logger.warning(f"Plan cancelled, skipping remaining steps from step {step.get('step_number', 0)}")
+                cancelled = True
+                break
+            
             try:
                 instruction = step.get('instruction', '')
                 step_number = step.get('step_number', 0)
@@ -337,7 +568,8 @@ class NovaActAgent:
                 
                 # Execute the step with retry logic and credentials
                 execution_result = self._execute_step_with_retry(
-                    nova_act, instruction, step_number, nova_act_type, timeout_seconds, retry_count, credentials
+                    nova_act, instruction, step_number, nova_act_type, timeout_seconds, retry_count, credentials,
+                    cancel_event
                 )
                 
                 completed_steps.append(execution_result)
@@ -350,6 +582,11 @@ class NovaActAgent:
                     failed_step = execution_result
                     logger.warning(f"Step {step_number} failed: {execution_result.error_message}")
                     
+                    # A cancelled plan must not drive the browser any further
+                    if cancel_event.is_set():
+                        cancelled = True
+                        break
+                    
                     # If step failed, try error detection to understand why
                     try:
                         error_detection = self._detect_errors_with_bool_schema(nova_act)
@@ -372,11 +609,11 @@ class NovaActAgent:
                     except Exception as e:
                         logger.warning(f"Error detection failed after step {step_number}: {str(e)}")
                 
-                # Small delay between steps
-                time.sleep(1)
+                # Small delay between steps (cut short if the plan is cancelled)
+                cancel_event.wait(1)
                 
             except Exception as e:
-                logger.error(f"Error executing step {step_number}: {str(e)}")
+                logger.exception(f"Error executing step {step_number}: {str(e)}")
                 
                 execution_result = NovaActExecutionResult(
                     instruction=instruction,
@@ -392,6 +629,10 @@ class NovaActAgent:
                 failed_count += 1
                 failed_step = execution_result
                 
+                if cancel_event.is_set():
+                    cancelled = True
+                    break
+                
                 # Check for blackhole detection
                 error_detection = self._detect_errors_with_bool_schema(nova_act)
                 
@@ -400,7 +641,11 @@ class NovaActAgent:
                     break
         
         # Determine final status
-        if failed_count == 0:
+        if cancelled:
+            status = "failed"
+            message = f"Execution cancelled after {len(completed_steps)} of {len(micro_steps)} micro-steps"
+            requires_human = True
+        elif failed_count == 0:
             status = "success"
             message = f"Successfully executed all {len(micro_steps)} micro-steps"
             requires_human = False
@@ -425,7 +670,7 @@ class NovaActAgent:
             suggestions=[]
         )
     
-    def _detect_errors_with_bool_schema(self, nova_act: NovaAct) -> NovaActErrorDetection:
+    def _detect_errors_with_bool_schema(self, nova_act: "NovaAct") -> NovaActErrorDetection:
         """Detect errors using multiple BOOL_SCHEMA questions with improved prompts."""
         
         try:
@@ -489,127 +734,146 @@ class NovaActAgent:
                 suggestions=[f"Error detection failed: {str(e)}"]
             )
     
-    def _execute_step_with_retry(self, nova_act: NovaAct, instruction: str, step_number: int, 
+    def _execute_step_with_retry(self, nova_act: "NovaAct", instruction: str, step_number: int, 
                                 nova_act_type: str, timeout_seconds: int, retry_count: int, 
-                                credentials: Dict[str, Any] = None) -> NovaActExecutionResult:
+                                credentials: Dict[str, Any] = None,
+                                cancel_event: Optional[threading.Event] = None) -> NovaActExecutionResult:
         """Execute a single step with retry logic and proper error handling."""
         
-        for attempt in range(retry_count + 1):
-            try:
-                logger.info(f"Step {step_number} attempt {attempt + 1}/{retry_count + 1}")
-                
-                # Execute the step with secure credential handling
-                start_time = time.time()
-                
-                # Check if this is an input step that needs credentials
-                if nova_act_type == "input" and credentials:
-                    result = self._execute_input_step_with_credentials(nova_act, instruction, credentials)
-                else:
-                    result = nova_act.act(instruction)
-                
-                execution_time = time.time() - start_time
-                
-                # Parse result
-                result_text = ""
-                if hasattr(result, 'response') and result.response:
-                    result_text = str(result.response)
-                elif hasattr(result, 'parsed_response') and result.parsed_response:
-                    result_text = str(result.parsed_response)
-                else:
-                    result_text = str(result)
-                
-                # Check if the result indicates success
-                if self._is_step_successful(result, result_text, nova_act_type):
+        if cancel_event is None:
+            cancel_event = threading.Event()
+        
+        # Collect per-attempt outcomes and log them once when the step finishes
+        attempt_log: List[str] = []
+        any_attempt_failed = False
+        try:
+            for attempt in range(retry_count + 1):
+                if cancel_event.is_set():
+                    attempt_log.append(f"{attempt + 1}/{retry_count + 1} skipped, plan cancelled")
                     return NovaActExecutionResult(
                         instruction=instruction,
-                        status="success",
-                        result_text=result_text,
-                        error_message=None,
-                        execution_time=execution_time,
+                        status="failed",
+                        result_text="",
+                        error_message="Step cancelled after the plan timed out",
+                        execution_time=0.0,
                         retry_count=attempt,
                         browser_state={}
                     )
-                else:
-                    # Step didn't succeed, try again if we have retries left
+                
+                try:
+                    # Execute the step with secure credential handling
+                    start_time = time.time()
+                    
+                    # Check if this is an input step that needs credentials
+                    if nova_act_type == "input" and credentials:
+                        result = self._execute_input_step_with_credentials(
+                            nova_act, instruction, credentials, timeout_seconds
+                        )
+                    else:
+                        result = nova_act.act(instruction, timeout=timeout_seconds)
+                    
+                    execution_time = time.time() - start_time
+                    
+                    # Parse result
+                    result_text = ""
+                    if hasattr(result, 'response') and result.response:
+                        result_text = str(result.response)
+                    elif hasattr(result, 'parsed_response') and result.parsed_response:
+                        result_text = str(result.parsed_response)
+                    else:
+                        result_text = str(result)
+                    
+                    # Check if the result indicates success
+                    if self._is_step_successful(result, result_text, nova_act_type):
+                        attempt_log.append(f"{attempt + 1}/{retry_count + 1} succeeded in {execution_time:.1f}s")
+                        return NovaActExecutionResult(
+                            instruction=instruction,
+                            status="success",
+                            result_text=result_text,
+                            error_message=None,
+                            execution_time=execution_time,
+                            retry_count=attempt,
+                            browser_state={}
+                        )
+                    else:
+                        # Step didn't succeed, try again if we have retries left
+                        attempt_log.append(f"{attempt + 1}/{retry_count + 1} did not succeed")
+                        any_attempt_failed = True
+                        if attempt < retry_count:
+                            cancel_event.wait(2)  # Wait before retry
+                            continue
+                        else:
+                            # Final attempt failed
+                            return NovaActExecutionResult(
+                                instruction=instruction,
+                                status="failed",
+                                result_text=result_text,
+                                error_message=f"Step failed after {retry_count + 1} attempts",
+                                execution_time=execution_time,
+                                retry_count=attempt,
+                                browser_state={}
+                            )
+                            
+                except Exception as e:
+                    attempt_log.append(f"{attempt + 1}/{retry_count + 1} raised {str(e)}")
+                    any_attempt_failed = True
+                    
                     if attempt < retry_count:
-                        logger.warning(f"Step {step_number} attempt {attempt + 1} didn't succeed, retrying...")
-                        time.sleep(2)  # Wait before retry
+                        cancel_event.wait(2)  # Wait before retry
                         continue
                     else:
-                        # Final attempt failed
+                        # Final attempt failed with exception
                         return NovaActExecutionResult(
                             instruction=instruction,
                             status="failed",
-                            result_text=result_text,
-                            error_message=f"Step failed after {retry_count + 1} attempts",
-                            execution_time=execution_time,
+                            result_text="",
+                            error_message=f"Step failed with exception after {retry_count + 1} attempts: {str(e)}",
+                            execution_time=0.0,
                             retry_count=attempt,
                             browser_state={}
                         )
-                        
-            except Exception as e:
-                logger.warning(f"Step {step_number} attempt {attempt + 1} failed with exception: {str(e)}")
-                
-                if attempt < retry_count:
-                    time.sleep(2)  # Wait before retry
-                    continue
-                else:
-                    # Final attempt failed with exception
-                    return NovaActExecutionResult(
-                        instruction=instruction,
-                        status="failed",
-                        result_text="",
-                        error_message=f"Step failed with exception after {retry_count + 1} attempts: {str(e)}",
-                        execution_time=0.0,
-                        retry_count=attempt,
-                        browser_state={}
-                    )
-        
-        # This should never be reached, but just in case
-        return NovaActExecutionResult(
-            instruction=instruction,
-            status="failed",
-            result_text="",
-            error_message="Step failed after all retry attempts",
-            execution_time=0.0,
-            retry_count=retry_count,
-            browser_state={}
-        )
+            
+            # This should never be reached, but just in case
+            return NovaActExecutionResult(
+                instruction=instruction,
+                status="failed",
+                result_text="",
+                error_message="Step failed after all retry attempts",
+                execution_time=0.0,
+                retry_count=retry_count,
+                browser_state={}
+            )
+        finally:
+            # Failed or raising attempts keep their WARNING level in the summary
+            log = logger.warning if any_attempt_failed else logger.info
+            log("Step {} attempts: {}", step_number, "; ".join(attempt_log))
     
     def _is_step_successful(self, result, result_text: str, nova_act_type: str) -> bool:
         """Determine if a step was successful based on the result and type."""
         try:
             # Check for explicit success indicators in the result
             if hasattr(result, 'response') and result.response:
-                response_lower = str(result.response).lower()
-                if any(success_word in response_lower for success_word in ['success', 'completed', 'done', 'finished']):
+                response_text = str(result.response)
+                if RESPONSE_SUCCESS_RE.search(response_text):
                     return True
-                if any(error_word in response_lower for error_word in ['error', 'failed', 'cannot', 'unable']):
+                if RESPONSE_ERROR_RE.search(response_text):
                     return False
             
-            # For navigation steps, success is usually just reaching the page
-            if nova_act_type == "navigate":
-                return True
-            
-            # For click steps, success is usually if no error occurred
-            if nova_act_type == "click":
-                return "error" not in result_text.lower()
-            
-            # For input steps, success is usually if text was entered
-            if nova_act_type == "input":
-                return "entered" in result_text.lower() or "filled" in result_text.lower()
-            
-            # For other steps, assume success if no explicit error
-            return "error" not in result_text.lower() and "failed" not in result_text.lower()
+            # Dispatch on the step type; other steps succeed if no explicit error
+            success_check = STEP_SUCCESS_CHECKS.get(nova_act_type, _default_step_success)
+            return success_check(result_text.lower())
             
         except Exception as e:
             logger.warning(f"Error checking step success: {str(e)}")
             return True  # Default to success if we can't determine
     
-    def _safe_act_with_bool_schema(self, nova_act: NovaAct, prompt: str) -> bool:
+    def _safe_act_with_bool_schema(self, nova_act: "NovaAct", prompt: str,
+                                   timeout_seconds: int = ERROR_DETECTION_TIMEOUT_SECONDS) -> bool:
         """Safely execute a BOOL_SCHEMA act with fallback handling."""
         try:
-            result = nova_act.act(prompt, schema=BOOL_SCHEMA)
+            from nova_act import BOOL_SCHEMA
+            
+            result = nova_act.act(prompt, schema=BOOL_SCHEMA, timeout=timeout_seconds)
             
             # Check if the result is valid
             if hasattr(result, 'matches_schema') and result.matches_schema:
@@ -631,7 +895,8 @@ class NovaActAgent:
             logger.warning(f"Error in safe_act_with_bool_schema: {str(e)}, defaulting to False")
             return False
     
-    def _execute_input_step_with_credentials(self, nova_act: NovaAct, instruction: str, credentials: Dict[str, Any]) -> Any:
+    def _execute_input_step_with_credentials(self, nova_act: "NovaAct", instruction: str, credentials: Dict[str, Any],
+                                             timeout_seconds: int = 30) -> Any:
         """
         Execute input step with secure credential handling using Playwright's API.
         
@@ -639,23 +904,25 @@ class NovaActAgent:
             nova_act: Nova Act instance
             instruction: The instruction for the input step
             credentials: User credentials dictionary
+            timeout_seconds: Timeout for each Nova Act call
             
         Returns:
             Result from Nova Act execution
         """
         try:
             # First, let Nova Act identify the input field
-            field_identification_result = nova_act.act(instruction)
+            field_identification_result = nova_act.act(instruction, timeout=timeout_seconds)
             
             # Determine which credential to use based on the instruction
             credential_value = None
-            if "username" in instruction.lower() or "email" in instruction.lower():
+            instruction_lower = instruction.lower()
+            if "username" in instruction_lower or "email" in instruction_lower:
                 credential_value = credentials.get('email', '')
-            elif "password" in instruction.lower():
+            elif "password" in instruction_lower:
                 credential_value = credentials.get('password', '')
-            elif "ic" in instruction.lower() or "identity" in instruction.lower():
+            elif "ic" in instruction_lower or "identity" in instruction_lower:
                 credential_value = credentials.get('ic_number', '')
-            elif "phone" in instruction.lower():
+            elif "phone" in instruction_lower:
                 credential_value = credentials.get('phone', '')
             
             if credential_value:
@@ -678,7 +945,7 @@ class NovaActAgent:
         except Exception as e:
             logger.error(f"Error in secure credential input: {str(e)}")
             # Fallback to regular Nova Act execution
-            return nova_act.act(instruction)
+            return nova_act.act(instruction, timeout=timeout_seconds)
 
 
 # Global Nova Act agent instance
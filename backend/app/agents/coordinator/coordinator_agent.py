@@ -8,7 +8,6 @@ Implements Phase 1 of the 3-agent architecture with:
 """
 
 import asyncio
-import os
 import time
 import json
 import uuid
@@ -26,7 +25,8 @@ from pydantic import BaseModel, Field
 
 from app.core.logging import get_logger
 from app.config import settings
-from .tavily_tool import TavilySearchTool
+from app.services.dynamodb_service import DYNAMODB_CLIENT_CONFIG
+from .tavily_tool import get_tavily_search_tool
 from ..validator.validator_agent import ValidatorAgent, validator_agent
 from ..automation.automation_agent import AutomationAgent, automation_agent
 from ..automation.nova_act_agent import NovaActAgent, nova_act_agent
@@ -34,6 +34,22 @@ from ..automation.nova_act_agent import NovaActAgent, nova_act_agent
 logger = get_logger(__name__)
 
 
+def _parse_handle_directly(value: Any) -> Optional[bool]:
+    """
+    Read the model's handle_directly field strictly.
+    
+    Only a real bool or the exact strings "true"/"false" count; anything else
+    returns None so the classification crew decides instead.
+    """
+    if isinstance(value, bool):
+        return value
+    if value == "true":
+        return True
+    if value == "false":
+        return False
+    return None
+
+
 @dataclass
 class IntentAnalysis:
     """Data class for intent analysis results."""
@@ -45,6 +61,7 @@ class IntentAnalysis:
     missing_information: List[str]
     suggested_next_steps: List[str]
     reasoning: str
+    handle_directly: Optional[bool] = None
 
 
 @dataclass
@@ -100,6 +117,10 @@ Think step by step:
    - Should credentials be requested from the user?
    - Should this be delegated to a specialist agent?
 
+6. **Handling Decision**:
+   - Handle directly if: Simple greeting, basic question, or non-government request
+   - Process through workflow if: Government service request, requires research, or needs credentials
+
 Based on your analysis, provide a structured response in JSON format:
 {{
     "intent_type": "payment|inquiry|registration|renewal|other",
@@ -109,6 +130,7 @@ Based on your analysis, provide a structured response in JSON format:
     "requires_credentials": true/false,
     "missing_information": ["list of missing info"],
     "suggested_next_steps": ["list of next actions"],
+    "handle_directly": true/false,
     "reasoning": "your detailed reasoning process"
 }}"""
     
@@ -207,11 +229,19 @@ class DynamoDBMemoryManager:
     """DynamoDB-based memory manager for persistent conversation storage."""
     
     def __init__(self, table_name: str = "crewai-memory", messages_table: str = "ai4ai-chat-messages"):
-        self.dynamodb = boto3.resource('dynamodb')
+        self.dynamodb = boto3.resource('dynamodb', config=DYNAMODB_CLIENT_CONFIG)
         self.table_name = table_name
         self.messages_table_name = messages_table
         self.table = self.dynamodb.Table(table_name)
         self.messages_table = self.dynamodb.Table(messages_table)
+    
+    def _thread_table(self):
+        """Get a Table handle for use in a worker thread.
+        
+        boto3 resource objects are not thread-safe, so each worker gets its own
+        handle; they share the resource's underlying (thread-safe) client.
+        """
+        return self.dynamodb.Table(self.table_name)
         
     async def save_conversation_memory(self, session_id: str, user_id: str, 
                                      user_message: str, agent_response: str, 
@@ -250,18 +280,20 @@ class DynamoDBMemoryManager:
         try:
             from boto3.dynamodb.conditions import Key
             
-            response = self.table.query(
+            response = await asyncio.to_thread(
+                self._thread_table().query,
                 KeyConditionExpression=Key('session_id').eq(session_id),
                 ScanIndexForward=True,  # Oldest first for conversation flow
                 Limit=limit
             )
             
-            logger.debug(f"Raw DynamoDB response for session {session_id}: {response}")
+            # Lazy formatting: the raw response is only rendered when debug logging is enabled
+            logger.debug("Raw DynamoDB response for session {}: {}", session_id, response)
             
             # Convert DynamoDB items to conversation history format
             conversation_history = []
             for item in response.get('Items', []):
-                logger.debug(f"Processing DynamoDB item: {item}")
+                logger.debug("Processing DynamoDB item: {}", item)
                 
                 try:
                     # Safely extract values from DynamoDB format
@@ -291,7 +323,7 @@ class DynamoDBMemoryManager:
                     # Only add if there's actual content
                     if conv_item['user_message'] or conv_item['agent_response']:
                         conversation_history.append(conv_item)
-                        logger.debug(f"Added conversation item: {conv_item}")
+                        logger.debug("Added conversation item: {}", conv_item)
                         
                 except Exception as item_error:
                     logger.warning(f"Error processing DynamoDB item {item}: {item_error}")
@@ -310,7 +342,8 @@ class DynamoDBMemoryManager:
     async def get_user_entity_memory(self, user_id: str) -> Optional[Dict]:
         """Get user-specific entity memory (preferences, service history, etc.)."""
         try:
-            response = self.table.get_item(
+            response = await asyncio.to_thread(
+                self._thread_table().get_item,
                 Key={
                     'session_id': f"user_entity_{user_id}",
                     'timestamp': "metadata"
@@ -410,7 +443,7 @@ class CoordinatorAgent:
         
         # Initialize tools
         try:
-            self.tavily_tool = TavilySearchTool()
+            self.tavily_tool = get_tavily_search_tool()
         except Exception as e:
             logger.warning(f"Failed to initialize Tavily tool: {str(e)}")
             self.tavily_tool = None
@@ -435,6 +468,12 @@ class CoordinatorAgent:
         # Initialize research agent
         self.research_agent = self._create_research_agent()
         
+        # Helper agents for crews kicked off synchronously on the event loop.
+        # CrewAI agents hold per-run state (crew, executor), so agents whose crews
+        # run concurrently (kickoff_async, worker threads) are built per call instead
+        self.decision_agent = self._create_decision_agent()
+        self.casual_agent = self._create_casual_agent()
+        
         # Rate limiting
         self.last_request_time = 0
         self.min_request_interval = 3.0
@@ -488,9 +527,9 @@ class CoordinatorAgent:
             # Use CrewAI's LLM class with proper provider format and streaming enabled
             return LLM(
                 model="bedrock/amazon.nova-lite-v1:0",
-                aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-                aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-                aws_region_name=os.getenv('BEDROCK_REGION', 'ap-southeast-2'),  # Use Bedrock region
+                aws_access_key_id=settings.aws_access_key_id,
+                aws_secret_access_key=settings.aws_secret_access_key,
+                aws_region_name=settings.bedrock_region,  # Use Bedrock region
                 stream=True  # Enable streaming for real-time responses
             )
         except Exception as e:
@@ -547,6 +586,40 @@ class CoordinatorAgent:
             max_execution_time=300
         )
     
+    def _create_decision_agent(self) -> Agent:
+        """Create an agent that classifies requests as DIRECT or PROCESS."""
+        return Agent(
+            role="Request Classification Specialist",
+            goal="Intelligently classify user requests to determine the best handling approach",
+            backstory=(
+                "You are an expert at analyzing user requests and determining whether they should be "
+                "handled directly with a simple response or require deeper processing through the "
+                "government service workflow. You consider context, intent, and user needs."
+            ),
+            llm=self.llm,
+            memory=False,
+            verbose=False,
+            max_iter=3,
+            max_execution_time=30
+        )
+    
+    def _create_casual_agent(self) -> Agent:
+        """Create an agent for casual greetings and non-government requests."""
+        return Agent(
+            role="Friendly Government Service Assistant",
+            goal="Provide warm, helpful responses to casual greetings while guiding users toward government services",
+            backstory=(
+                "You are a friendly and professional assistant for Malaysian government services. "
+                "You respond warmly to casual greetings while naturally guiding users toward "
+                "government service assistance. You're helpful, knowledgeable, and encouraging."
+            ),
+            llm=self.llm,
+            memory=False,
+            verbose=False,
+            max_iter=2,
+            max_execution_time=20
+        )
+    
     def _create_research_agent(self) -> Agent:
         """Create a specialized agent for research using Tavily integration."""
         tools = [self.tavily_tool] if self.tavily_tool else []
@@ -592,15 +665,12 @@ class CoordinatorAgent:
             
             # No complex human interaction setup needed - using simple prompting
             
-            # Get conversation history if session_id provided
-            conversation_history = []
-            if session_id:
-                conversation_history = await self.memory_manager.get_conversation_history(session_id)
-            
-            # Get user entity memory if user_id provided
-            user_entity_memory = None
-            if user_id:
-                user_entity_memory = await self.memory_manager.get_user_entity_memory(user_id)
+            # Fetch conversation history and user entity memory concurrently;
+            # the two DynamoDB lookups are independent of each other
+            conversation_history, user_entity_memory = await asyncio.gather(
+                self._get_conversation_history(session_id),
+                self._get_user_entity_memory(user_id)
+            )
             
             # Single intelligent processing task with memory context
             result = await self._retry_with_backoff(
@@ -640,6 +710,18 @@ class CoordinatorAgent:
                 "error_details": str(e)
             }
     
+    async def _get_conversation_history(self, session_id: Optional[str]) -> List[Dict]:
+        """Get conversation history if a session_id is provided."""
+        if not session_id:
+            return []
+        return await self.memory_manager.get_conversation_history(session_id)
+    
+    async def _get_user_entity_memory(self, user_id: Optional[str]) -> Optional[Dict]:
+        """Get user entity memory if a user_id is provided."""
+        if not user_id:
+            return None
+        return await self.memory_manager.get_user_entity_memory(user_id)
+    
     async def _intelligent_process_request(self, user_message: str, user_context: Dict[str, Any], 
                                          conversation_history: List[Dict] = None, 
                                          user_entity_memory: Dict = None,
@@ -667,14 +749,16 @@ class CoordinatorAgent:
             if intent_analysis.missing_information:
                 return await self._handle_missing_information(intent_analysis, research_results)
             
-            # Step 5: Extract credentials from user message for automation
-            extracted_credentials = await self._extract_credentials_from_message(user_message, user_context)
-            
-            # Step 6: Validate task flow using Validator Agent (only for government service requests)
-            validation_result = await self.validator_agent.validate_task_flow(
-                coordinator_instructions="",
-                intent_analysis=intent_analysis.__dict__,
-                research_results=research_results.__dict__ if research_results else None
+            # Step 5 & 6: Extract credentials from user message for automation and
+            # validate task flow using Validator Agent. Neither depends on the
+            # other, so both LLM calls run concurrently.
+            extracted_credentials, validation_result = await asyncio.gather(
+                self._extract_credentials_from_message(user_message, user_context),
+                self.validator_agent.validate_task_flow(
+                    coordinator_instructions="",
+                    intent_analysis=intent_analysis.__dict__,
+                    research_results=research_results.__dict__ if research_results else None
+                )
             )
             
             # Step 7: Prepare for delegation to Automation Agent
@@ -712,7 +796,7 @@ class CoordinatorAgent:
             # Stage 2: Execute the plan using Nova Act Agent
             logger.info("Stage 2: Executing plan with Nova Act Agent...")
             execution_plan = execution_plan_result["execution_plan"]
-            nova_act_result = self.nova_act_agent.execute_execution_plan(execution_plan)
+            nova_act_result = await self.nova_act_agent.aexecute_execution_plan(execution_plan)
             
             # Stage 3: Process Nova Act result and determine next action
             logger.info("Stage 3: Processing Nova Act result...")
@@ -722,7 +806,7 @@ class CoordinatorAgent:
                 "validation_result": validation_result
             }
             
-            processed_result = self.automation_agent.process_nova_act_result(nova_act_result, automation_task)
+            processed_result = await self.automation_agent.aprocess_nova_act_result(nova_act_result, automation_task)
             
             # Handle different actions based on processed result
             action = processed_result.get("action", "inform_user")
@@ -747,10 +831,10 @@ class CoordinatorAgent:
                 
                 # Execute the improved plan with Nova Act Agent
                 logger.info("Executing improved plan with Nova Act Agent...")
-                retry_nova_act_result = self.nova_act_agent.execute_execution_plan(improved_execution_plan)
+                retry_nova_act_result = await self.nova_act_agent.aexecute_execution_plan(improved_execution_plan)
                 
                 # Process the retry result
-                retry_processed_result = self.automation_agent.process_nova_act_result(retry_nova_act_result, automation_task)
+                retry_processed_result = await self.automation_agent.aprocess_nova_act_result(retry_nova_act_result, automation_task)
                 
                 # Handle the retry result
                 retry_action = retry_processed_result.get("action", "inform_user")
@@ -911,7 +995,7 @@ class CoordinatorAgent:
                 verbose=False  # Keep quiet for production
             )
             
-            result = crew.kickoff()
+            result = await crew.kickoff_async()
             
             # Parse the JSON response
             import json
@@ -957,21 +1041,11 @@ class CoordinatorAgent:
         Use AI-driven decision making to determine if request should be handled directly.
         This replaces rule-based logic with intelligent analysis.
         """
-        # Create an AI agent to make this decision intelligently
-        decision_agent = Agent(
-            role="Request Classification Specialist",
-            goal="Intelligently classify user requests to determine the best handling approach",
-            backstory=(
-                "You are an expert at analyzing user requests and determining whether they should be "
-                "handled directly with a simple response or require deeper processing through the "
-                "government service workflow. You consider context, intent, and user needs."
-            ),
-            llm=self.llm,
-            memory=False,
-            verbose=False,
-            max_iter=3,
-            max_execution_time=30
-        )
+        # The intent prompt already asks for the decision; only fall back to a
+        # separate classification call when the model left it out
+        if intent_analysis.handle_directly is not None:
+            logger.info(f"Intent decision for '{user_message}': {'DIRECT' if intent_analysis.handle_directly else 'PROCESS'}")
+            return intent_analysis.handle_directly
         
         # Create a task for intelligent decision making
         decision_task = Task(
@@ -996,12 +1070,12 @@ class CoordinatorAgent:
             Respond with only "DIRECT" or "PROCESS" based on your analysis.
             """,
             expected_output="Either 'DIRECT' or 'PROCESS'",
-            agent=decision_agent
+            agent=self.decision_agent
         )
         
         # Execute the decision
         decision_crew = Crew(
-            agents=[decision_agent],
+            agents=[self.decision_agent],
             tasks=[decision_task],
             process=Process.sequential,
             verbose=False
@@ -1023,22 +1097,6 @@ class CoordinatorAgent:
         """
         Handle casual greetings and non-government requests with intelligent AI-driven responses.
         """
-        # Create an AI agent for intelligent casual response generation
-        casual_agent = Agent(
-            role="Friendly Government Service Assistant",
-            goal="Provide warm, helpful responses to casual greetings while guiding users toward government services",
-            backstory=(
-                "You are a friendly and professional assistant for Malaysian government services. "
-                "You respond warmly to casual greetings while naturally guiding users toward "
-                "government service assistance. You're helpful, knowledgeable, and encouraging."
-            ),
-            llm=self.llm,
-            memory=False,
-            verbose=False,
-            max_iter=2,
-            max_execution_time=20
-        )
-        
         # Create a task for intelligent response generation
         response_task = Task(
             description=f"""
@@ -1058,12 +1116,12 @@ class CoordinatorAgent:
             Generate a natural, helpful response.
             """,
             expected_output="A warm, helpful response that acknowledges the user and guides them toward government services",
-            agent=casual_agent
+            agent=self.casual_agent
         )
         
         # Execute the response generation
         response_crew = Crew(
-            agents=[casual_agent],
+            agents=[self.casual_agent],
             tasks=[response_task],
             process=Process.sequential,
             verbose=False
@@ -1115,6 +1173,9 @@ class CoordinatorAgent:
             # Parse the JSON response
             intent_data = self._parse_intent_response(str(result))
             
+            # The DIRECT/PROCESS decision comes back with the intent when the model provides it
+            handle_directly = _parse_handle_directly(intent_data.get('handle_directly'))
+            
             # Create IntentAnalysis object
             return IntentAnalysis(
                 intent_type=intent_data.get('intent_type', 'unknown'),
@@ -1124,7 +1185,8 @@ class CoordinatorAgent:
                 requires_credentials=bool(intent_data.get('requires_credentials', False)),
                 missing_information=intent_data.get('missing_information', []),
                 suggested_next_steps=intent_data.get('suggested_next_steps', []),
-                reasoning=intent_data.get('reasoning', '')
+                reasoning=intent_data.get('reasoning', ''),
+                handle_directly=handle_directly
             )
             
         except Exception as e:
@@ -114,25 +114,29 @@ async def send_human_interaction_request(interaction_type: str, data: Dict[str,
 
 def _console_fallback(interaction_type: str, data: Dict[str, Any]) -> str:
     """Console fallback for testing/development when no callback is set."""
-    print(f"\n{'='*60}")
-    print(f"🤖 COORDINATOR NEEDS INPUT ({interaction_type.upper()})")
-    print(f"{'='*60}")
+    # Build the whole prompt first and write it with a single print
+    lines = [
+        f"\n{'='*60}",
+        f"🤖 COORDINATOR NEEDS INPUT ({interaction_type.upper()})",
+        f"{'='*60}"
+    ]
     
     if interaction_type == "information":
         info_type = data.get('information_type', 'information')
         context = data.get('context', '')
-        print(f"Information needed: {info_type}")
+        lines.append(f"Information needed: {info_type}")
         if context:
-            print(f"Context: {context}")
+            lines.append(f"Context: {context}")
         if data.get('is_sensitive'):
-            print("⚠️ This appears to be sensitive information.")
+            lines.append("⚠️ This appears to be sensitive information.")
+        print("\n".join(lines))
         return input(f"Enter {info_type}: ").strip()
         
     elif interaction_type == "choice":
-        print(f"Question: {data.get('question', '')}")
+        lines.append(f"Question: {data.get('question', '')}")
         options = data.get('options', [])
-        for i, option in enumerate(options, 1):
-            print(f"{i}. {option}")
+        lines.extend(f"{i}. {option}" for i, option in enumerate(options, 1))
+        print("\n".join(lines))
         choice = input(f"Your choice (1-{len(options)}): ").strip()
         try:
             return options[int(choice) - 1]
@@ -140,11 +144,13 @@ def _console_fallback(interaction_type: str, data: Dict[str, Any]) -> str:
             return choice
             
     elif interaction_type == "confirmation":
-        print(f"Action: {data.get('action_description', '')}")
-        print(f"Risk Level: {data.get('risk_level', 'medium')}")
+        lines.append(f"Action: {data.get('action_description', '')}")
+        lines.append(f"Risk Level: {data.get('risk_level', 'medium')}")
+        print("\n".join(lines))
         response = input("Do you want to proceed? (y/n): ").strip().lower()
         return "yes" if response in ['y', 'yes'] else "no"
-        
+    
+    print("\n".join(lines))
     return "No response"
 
 
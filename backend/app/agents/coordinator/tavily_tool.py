@@ -2,10 +2,11 @@
 Tavily search tool for government service research.
 """
 
+import functools
 from typing import Dict, Any, List, Optional
 from crewai.tools import BaseTool
 from tavily import TavilyClient
-import os
+from app.config import settings
 from app.core.logging import get_logger
 from dotenv import load_dotenv
 from pydantic import Field
@@ -13,6 +14,22 @@ from pydantic import Field
 load_dotenv()
 logger = get_logger(__name__)
 
+# Restrict research to official service sites and skip social media noise
+SEARCH_INCLUDE_DOMAINS = (
+    "jpj.gov.my",
+    "myeg.com.my",
+    "hasil.gov.my",
+    "jpn.gov.my",
+    "kwsp.gov.my",
+    "gov.my"
+)
+SEARCH_EXCLUDE_DOMAINS = (
+    "facebook.com",
+    "twitter.com",
+    "instagram.com",
+    "youtube.com"
+)
+
 
 class TavilySearchTool(BaseTool):
     """Tavily search tool for researching government services and processes."""
@@ -35,7 +52,7 @@ class TavilySearchTool(BaseTool):
     def _initialize_client(self):
         """Initialize Tavily client with API key."""
         try:
-            api_key = os.getenv("TAVILY_API_KEY")
+            api_key = settings.tavily_api_key
             if not api_key:
                 logger.warning("TAVILY_API_KEY not found in environment variables")
                 return
@@ -67,20 +84,8 @@ class TavilySearchTool(BaseTool):
                 "include_answer": True,
                 "include_raw_content": False,
                 "max_results": 5,
-                "include_domains": [
-                    "jpj.gov.my",
-                    "myeg.com.my", 
-                    "hasil.gov.my",
-                    "jpn.gov.my",
-                    "kwsp.gov.my",
-                    "gov.my"
-                ],
-                "exclude_domains": [
-                    "facebook.com",
-                    "twitter.com", 
-                    "instagram.com",
-                    "youtube.com"
-                ]
+                "include_domains": list(SEARCH_INCLUDE_DOMAINS),
+                "exclude_domains": list(SEARCH_EXCLUDE_DOMAINS)
             }
             
             # Add any additional parameters from kwargs
@@ -174,3 +179,14 @@ class TavilySearchTool(BaseTool):
         query += " site:gov.my OR site:myeg.com.my OR site:jpj.gov.my OR site:hasil.gov.my OR site:jpn.gov.my OR site:kwsp.gov.my OR site:ssm.com.my"
         
         return self._run(query)
+
+
+@functools.cache
+def get_tavily_search_tool() -> TavilySearchTool:
+    """
+    Get the shared Tavily search tool.
+    
+    The coordinator and automation agents both use Tavily; sharing one tool
+    avoids building a second client and re-loading the tool schema.
+    """
+    return TavilySearchTool()
@@ -9,13 +9,18 @@ import re
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from dataclasses import dataclass
-import os
 from crewai import Agent, Task, Crew, Process, LLM
 from app.core.logging import get_logger
 from app.config import settings
 
 logger = get_logger(__name__)
 
+# Domain suffixes accepted as official government service sites
+GOVERNMENT_DOMAINS = (
+    'gov.my', 'myeg.com.my', 'jpj.gov.my', 'hasil.gov.my',
+    'jpn.gov.my', 'kwsp.gov.my', 'ssm.com.my'
+)
+
 
 @dataclass
 class ValidationResult:
@@ -35,11 +40,6 @@ class URLValidator:
     @staticmethod
     def validate_government_url(url: str) -> Dict[str, Any]:
         """Validate if URL is a legitimate government website."""
-        government_domains = [
-            'gov.my', 'myeg.com.my', 'jpj.gov.my', 'hasil.gov.my', 
-            'jpn.gov.my', 'kwsp.gov.my', 'ssm.com.my'
-        ]
-        
         validation_result = {
             'is_valid': False,
             'is_government': False,
@@ -61,10 +61,8 @@ class URLValidator:
             validation_result['domain'] = domain
             
             # Check if it's a government domain
-            for gov_domain in government_domains:
-                if domain.endswith(gov_domain):
-                    validation_result['is_government'] = True
-                    break
+            if domain.endswith(GOVERNMENT_DOMAINS):
+                validation_result['is_government'] = True
             
             # Check if it's secure
             if parsed_url.scheme == 'https':
@@ -181,9 +179,6 @@ class ValidatorAgent:
         # Initialize micro-step generator
         self.step_generator = MicroStepGenerator()
         
-        # Initialize validator agent
-        self.agent = self._create_validator_agent()
-        
         logger.info("Validator agent initialized successfully")
     
     def _initialize_llm(self) -> LLM:
@@ -191,9 +186,9 @@ class ValidatorAgent:
         try:
             return LLM(
                 model="bedrock/amazon.nova-lite-v1:0",
-                aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-                aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-                aws_region_name=os.getenv('BEDROCK_REGION', 'ap-southeast-2'),  # Use Bedrock region
+                aws_access_key_id=settings.aws_access_key_id,
+                aws_secret_access_key=settings.aws_secret_access_key,
+                aws_region_name=settings.bedrock_region,  # Use Bedrock region
                 stream=True
             )
         except Exception as e:
@@ -349,22 +344,27 @@ Provide your validation in JSON format:
 }}
 """
             
+            # Built per call: CrewAI agents hold per-run state, and concurrent
+            # requests run this crew at the same time via kickoff_async
+            validation_agent = self._create_validator_agent()
+            
             # Create validation task
             validation_task = Task(
                 description=validation_prompt,
                 expected_output="JSON response with process flow validation results",
-                agent=self.agent
+                agent=validation_agent
             )
             
             # Execute validation
             validation_crew = Crew(
-                agents=[self.agent],
+                agents=[validation_agent],
                 tasks=[validation_task],
                 process=Process.sequential,
                 verbose=True
             )
             
-            result = validation_crew.kickoff()
+            # Run off the event loop so callers can overlap other LLM work
+            result = await validation_crew.kickoff_async()
             
             # Parse response
             return self._parse_validation_response(str(result))
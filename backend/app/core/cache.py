@@ -0,0 +1,59 @@
+"""In-memory TTL cache for expensive, side-effect-free agent results."""
+
+import hashlib
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+
+def make_cache_key(*parts: str) -> str:
+    """Build a compact, fixed-size cache key from string parts."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        # Separator so ("ab", "c") and ("a", "bc") hash differently
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class TTLCache:
+    """Small thread-safe cache whose entries expire after a fixed TTL."""
+    
+    def __init__(self, ttl_seconds: float, max_entries: int = 256):
+        """
+        Initialize the cache.
+        
+        Args:
+            ttl_seconds: How long an entry stays valid
+            max_entries: Oldest entries are evicted beyond this size
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+    
+    def set(self, key: str, value: Any):
+        """Store a value, evicting the oldest entry when full."""
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.max_entries:
+                # Dicts keep insertion order, so the first key is the oldest
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+    
+    def clear(self):
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
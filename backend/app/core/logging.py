@@ -2,6 +2,7 @@
 
 import logging
 import os
+import sys
 from pathlib import Path
 from loguru import logger
 
@@ -18,12 +19,14 @@ def setup_logging():
     # Remove default handler
     logger.remove()
     
-    # Add console handler
+    # Add console handler. Both sinks use enqueue=True so records are written
+    # by loguru's background worker instead of on the calling thread/event loop.
     logger.add(
-        sink=lambda msg: print(msg, end=""),
+        sink=sys.stdout,
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
         level=settings.log_level,
-        colorize=True
+        colorize=True,
+        enqueue=True
     )
     
     # Add file handler
@@ -33,7 +36,8 @@ def setup_logging():
         level=settings.log_level,
         rotation="1 day",
         retention="30 days",
-        compression="zip"
+        compression="zip",
+        enqueue=True
     )
     
     # Configure standard library logging
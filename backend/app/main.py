@@ -8,9 +8,11 @@ from contextlib import asynccontextmanager
 
 from app.config import settings
 from app.routers import health, chat, auth, websocket, browser
-from app.core.logging import setup_logging
+from app.core.logging import setup_logging, get_logger
 from app.middleware.auth_middleware import AuthMiddleware
 
+logger = get_logger(__name__)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -22,38 +24,49 @@ async def lifespan(app: FastAPI):
     from app.services.dynamodb_service import dynamodb_service
     try:
         await dynamodb_service.create_tables_if_not_exist()
-        print("✅ DynamoDB initialization completed successfully")
+        logger.info("✅ DynamoDB initialization completed successfully")
     except Exception as e:
-        print(f"⚠️  Warning: Could not initialize DynamoDB tables: {e}")
-        print("   The server will continue without DynamoDB. Chat data will not persist.")
-        print("   To fix: Set AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY environment variables.")
+        logger.warning(
+            f"⚠️  Could not initialize DynamoDB tables: {e}. "
+            "The server will continue without DynamoDB. Chat data will not persist. "
+            "To fix: Set AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY environment variables."
+        )
     
     # Initialize services
     from app.agents.coordinator.coordinator_agent import coordinator_agent
     from app.agents.automation.automation_agent import automation_agent    
     
-    print("🚀 Application startup completed")
+    logger.info("🚀 Application startup completed")
     
     # Yield control to FastAPI - this is where the app runs
     yield
     
     # Shutdown
-    print("🔄 Starting application shutdown...")
+    logger.info("🔄 Starting application shutdown...")
     
     # Clean up browser sessions
     try:
         await automation_agent.close_browser()
     except KeyboardInterrupt:
-        print("Shutdown interrupted by user (KeyboardInterrupt)")
+        logger.warning("Shutdown interrupted by user (KeyboardInterrupt)")
         # Still try to close browsers even if interrupted
         try:
             await automation_agent.close_browser()
         except Exception as cleanup_error:
-            print(f"Error during cleanup after interrupt: {cleanup_error}")
+            logger.error(f"Error during cleanup after interrupt: {cleanup_error}")
     except Exception as e:
-        print(f"Error closing browser session: {e}")
+        logger.error(f"Error closing browser session: {e}")
+    
+    # Release the shared DynamoDB connection pool
+    try:
+        await dynamodb_service.close()
+    except Exception as e:
+        logger.error(f"Error closing DynamoDB client: {e}")
+    
+    logger.info("✅ Application shutdown completed")
     
-    print("✅ Application shutdown completed")
+    # Drain the enqueued log records before the process exits
+    await logger.complete()
 
 
 # Create FastAPI application
@@ -1,16 +1,22 @@
 """WebSocket router for real-time browser viewer communication."""
 
-import json
 import asyncio
 from typing import Dict, Set
 from fastapi import WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.routing import APIRouter
+import orjson
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
 router = APIRouter()
 
+
+def _dumps(message: dict) -> str:
+    """Serialize an outgoing message to JSON text using orjson."""
+    return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Store active WebSocket connections by session ID
 active_connections: Dict[str, Set[WebSocket]] = {}
 
@@ -53,17 +59,19 @@ class ConnectionManager:
     async def send_personal_message(self, message: dict, websocket: WebSocket):
         """Send a message to a specific WebSocket connection."""
         try:
-            await websocket.send_text(json.dumps(message))
+            await websocket.send_text(_dumps(message))
         except Exception as e:
             logger.error(f"Error sending personal message: {e}")
     
     async def send_to_session(self, message: dict, session_id: str):
         """Send a message to all connections in a session."""
         if session_id in self.active_connections:
+            # Serialize once for all connections in the session
+            payload = _dumps(message)
             disconnected = set()
             for websocket in self.active_connections[session_id]:
                 try:
-                    await websocket.send_text(json.dumps(message))
+                    await websocket.send_text(payload)
                 except Exception as e:
                     logger.error(f"Error sending message to session {session_id}: {e}")
                     disconnected.add(websocket)
@@ -136,7 +144,7 @@ async def websocket_browser_viewer(websocket: WebSocket, session_id: str):
             try:
                 # Receive message from client
                 data = await websocket.receive_text()
-                message = json.loads(data)
+                message = orjson.loads(data)
                 
                 # Handle different message types
                 if message.get("type") == "request_browser_status":
@@ -167,7 +175,7 @@ async def websocket_browser_viewer(websocket: WebSocket, session_id: str):
                 else:
                     logger.warning(f"Unknown message type received: {message.get('type')}")
             
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.error(f"Invalid JSON received from session {session_id}: {e}")
                 await manager.send_personal_message({
                     "type": "error",
@@ -1,15 +1,22 @@
 """DynamoDB service for chat session and message management."""
 
+import asyncio
 import boto3
 import aioboto3
+from contextlib import AsyncExitStack, nullcontext
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-import json
+import orjson
 import uuid
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 from app.config import settings
 from app.core.logging import logger
 
+# Shared client settings: a larger pool than botocore's default of 10 so
+# concurrent requests reuse warm HTTPS connections instead of queueing
+DYNAMODB_CLIENT_CONFIG = Config(max_pool_connections=25)
+
 
 class DynamoDBService:
     """Service for managing chat sessions and messages in DynamoDB."""
@@ -20,9 +27,17 @@ class DynamoDBService:
         self.sessions_table = settings.dynamodb_chat_sessions_table
         self.messages_table = settings.dynamodb_chat_messages_table
         
+        # Settings are fixed for the process lifetime, so check credentials once
+        self.credentials_configured = bool(settings.aws_access_key_id and settings.aws_secret_access_key)
+        
         # Session for aioboto3 (async operations)
         self.session = aioboto3.Session()
         
+        # Shared async client, opened on first use and closed in close()
+        self._async_client = None
+        self._async_client_stack: Optional[AsyncExitStack] = None
+        self._async_client_lock = asyncio.Lock()
+        
         # Regular boto3 client for sync operations
         self._sync_client = None
         
@@ -34,24 +49,49 @@ class DynamoDBService:
                 'dynamodb',
                 region_name=self.region,
                 aws_access_key_id=settings.aws_access_key_id,
-                aws_secret_access_key=settings.aws_secret_access_key
+                aws_secret_access_key=settings.aws_secret_access_key,
+                config=DYNAMODB_CLIENT_CONFIG
             )
         return self._sync_client
     
     async def get_async_client(self):
-        """Get asynchronous DynamoDB client."""
-        return self.session.client(
-            'dynamodb',
-            region_name=self.region,
-            aws_access_key_id=settings.aws_access_key_id,
-            aws_secret_access_key=settings.aws_secret_access_key
-        )
+        """
+        Get the shared asynchronous DynamoDB client.
+        
+        The client is created once so its connection pool is reused across
+        operations. It is returned wrapped in a context manager that leaves it
+        open, so callers keep using ``async with await self.get_async_client()``.
+        """
+        if self._async_client is None:
+            async with self._async_client_lock:
+                if self._async_client is None:
+                    stack = AsyncExitStack()
+                    self._async_client = await stack.enter_async_context(
+                        self.session.client(
+                            'dynamodb',
+                            region_name=self.region,
+                            aws_access_key_id=settings.aws_access_key_id,
+                            aws_secret_access_key=settings.aws_secret_access_key,
+                            config=DYNAMODB_CLIENT_CONFIG
+                        )
+                    )
+                    self._async_client_stack = stack
+        return nullcontext(self._async_client)
+    
+    async def close(self):
+        """Close the shared asynchronous client and its connection pool."""
+        if self._async_client_stack is not None:
+            stack = self._async_client_stack
+            self._async_client = None
+            self._async_client_stack = None
+            await stack.aclose()
+            logger.info("DynamoDB async client closed")
     
     async def create_tables_if_not_exist(self):
         """Create DynamoDB tables if they don't exist."""
         try:
             # Quick check for AWS credentials first
-            if not settings.aws_access_key_id or not settings.aws_secret_access_key:
+            if not self.credentials_configured:
                 logger.warning("AWS credentials not configured. DynamoDB will not be available.")
                 logger.warning("Set AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY to enable DynamoDB.")
                 return
@@ -59,7 +99,6 @@ class DynamoDBService:
             logger.info("Initializing DynamoDB connection...")
             
             # Add timeout to prevent hanging
-            import asyncio
             try:
                 async with asyncio.timeout(10):  # 10 second timeout
                     async with await self.get_async_client() as client:
@@ -161,23 +200,23 @@ class DynamoDBService:
     async def create_session(self, user_id: str, title: str = None) -> Dict[str, Any]:
         """Create a new chat session."""
         # Check if AWS credentials are available
-        if not settings.aws_access_key_id or not settings.aws_secret_access_key:
+        if not self.credentials_configured:
             raise Exception("DynamoDB not available: AWS credentials not configured")
         
         session_id = str(uuid.uuid4())
-        created_at = datetime.utcnow()
+        # Format once; the default title reuses the ISO string's "YYYY-MM-DD HH:MM" prefix
+        created_at = datetime.utcnow().isoformat()
         
         session_data = {
             'user_id': {'S': user_id},
             'session_id': {'S': session_id},
-            'title': {'S': title or f"Chat Session {created_at.strftime('%Y-%m-%d %H:%M')}"},
-            'created_at': {'S': created_at.isoformat()},
-            'updated_at': {'S': created_at.isoformat()},
+            'title': {'S': title or f"Chat Session {created_at[:16].replace('T', ' ')}"},
+            'created_at': {'S': created_at},
+            'updated_at': {'S': created_at},
             'message_count': {'N': '0'}
         }
         
         try:
-            import asyncio
             async with asyncio.timeout(5):  # 5 second timeout for operations
                 async with await self.get_async_client() as client:
                     await client.put_item(
@@ -205,11 +244,10 @@ class DynamoDBService:
     async def get_user_sessions(self, user_id: str) -> List[Dict[str, Any]]:
         """Get all sessions for a user."""
         # Check if AWS credentials are available
-        if not settings.aws_access_key_id or not settings.aws_secret_access_key:
+        if not self.credentials_configured:
             raise Exception("DynamoDB not available: AWS credentials not configured")
             
         try:
-            import asyncio
             async with asyncio.timeout(5):  # 5 second timeout
                 async with await self.get_async_client() as client:
                     response = await client.query(
@@ -285,7 +323,7 @@ class DynamoDBService:
         }
         
         if metadata:
-            message_data['metadata'] = {'S': json.dumps(metadata)}
+            message_data['metadata'] = {'S': orjson.dumps(metadata, option=orjson.OPT_NON_STR_KEYS).decode()}
         
         try:
             async with await self.get_async_client() as client:
@@ -337,8 +375,8 @@ class DynamoDBService:
                 
                 if 'metadata' in item:
                     try:
-                        message['metadata'] = json.loads(item['metadata']['S'])
-                    except json.JSONDecodeError:
+                        message['metadata'] = orjson.loads(item['metadata']['S'])
+                    except orjson.JSONDecodeError:
                         message['metadata'] = {}
                 
                 messages.append(message)